@@ -38,11 +38,12 @@ voice.pitch_slew = -2.0
 voice.pitch_slew_time = 0.2
 
 # Envelope
-voice.attack_time = 0.0
-voice.attack_level = 1.0
-voice.decay_time = 0.75
-voice.sustain_level = 0.5
-voice.release_time = 1.0
+with voice:  # Rebuild the envelope once after all values are set
+    voice.attack_time = 0.0
+    voice.attack_level = 1.0
+    voice.decay_time = 0.75
+    voice.sustain_level = 0.5
+    voice.release_time = 1.0
 
 # Amplitude
 voice.amplitude = 0.75
@@ -68,10 +69,12 @@ midi = adafruit_midi.MIDI(
 
 while True:
     msg = midi.receive()
-    if isinstance(msg, NoteOn) and msg.velocity != 0:
-        led.value = True
-        voice.press(msg.note, msg.velocity)
-    elif isinstance(msg, NoteOff) or (isinstance(msg, NoteOn) and msg.velocity == 0):
-        led.value = False
-        voice.release()
+    while msg is not None:
+        if isinstance(msg, NoteOn) and msg.velocity != 0:
+            led.value = True
+            voice.press(msg.note, msg.velocity)
+        elif isinstance(msg, NoteOff) or (isinstance(msg, NoteOn) and msg.velocity == 0):
+            led.value = False
+            voice.release()
+        msg = midi.receive()
     voice.update()
@@ -33,10 +33,12 @@ midi = adafruit_midi.MIDI(
 
 while True:
     msg = midi.receive()
-    if isinstance(msg, NoteOn) and msg.velocity != 0:
-        led.value = True
-        voice.press(msg.note, msg.velocity)
-    elif isinstance(msg, NoteOff) or (isinstance(msg, NoteOn) and msg.velocity == 0):
-        led.value = False
-        voice.release()
+    while msg is not None:
+        if isinstance(msg, NoteOn) and msg.velocity != 0:
+            led.value = True
+            voice.press(msg.note, msg.velocity)
+        elif isinstance(msg, NoteOff) or (isinstance(msg, NoteOn) and msg.velocity == 0):
+            led.value = False
+            voice.release()
+        msg = midi.receive()
     voice.update()
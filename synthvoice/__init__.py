@@ -30,10 +30,40 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/dcooperdalrymple/CircuitPython_SynthVoice.git"
 
+import math
+
 import synthio
 import ulab.numpy as np
 from micropython import const
 
+_LERP_WAVEFORM = np.linspace(-16385, 16385, num=2, dtype=np.int16)
+_INV_127 = 1.0 / 127.0
+
+_LOG_2 = math.log(2)
+_INV_LOG_2 = 1.0 / _LOG_2
+_LOG_2_SEMITONE = _LOG_2 / 12
+
+try:
+    _log2 = math.log2
+except AttributeError:
+
+    def _log2(value: float) -> float:
+        return math.log(value) * _INV_LOG_2
+
+
+_SEMITONE_RATIOS = tuple(pow(2, n / 12) for n in range(-48, 49))
+
+
+def _clamp(value: float, minimum: float, maximum: float) -> float:
+    return minimum if value < minimum else (maximum if value > maximum else value)
+
+
+def _semitone_ratio(semitones: float) -> float:
+    # Whole semitones within +/- 4 octaves are read from the table
+    if -48 <= semitones <= 48 and semitones == int(semitones):
+        return _SEMITONE_RATIOS[int(semitones) + 48]
+    return math.exp(semitones * _LOG_2_SEMITONE)
+
 
 class LerpBlockInput:
     """Creates and manages a :class:`synthio.BlockInput` object to "lerp" (linear interpolation)
@@ -46,9 +76,10 @@ class LerpBlockInput:
 
     def __init__(self, rate: float = 0.05, value: float = 0.0):
         """Constructor method"""
+        self._rate = rate if rate > 0.001 else 0.001
         self._position = synthio.LFO(
-            waveform=np.linspace(-16385, 16385, num=2, dtype=np.int16),
-            rate=1 / max(rate, 0.001),
+            waveform=_LERP_WAVEFORM,
+            rate=1.0 / self._rate,
             scale=1,
             offset=0.5,
             once=True,
@@ -74,24 +105,28 @@ class LerpBlockInput:
     def value(self) -> float:
         """Get the current value of the linear interpolation output or set a new value to begin
         interpolation to from the current value state. Causes the interpolation process to
-        retrigger.
+        retrigger unless the value has already been reached.
         """
         return self._lerp.value
 
     @value.setter
     def value(self, value: float) -> None:
-        self._lerp.a = self._lerp.value
+        current = self._lerp.value
+        if current == value and self._lerp.b == value:
+            return
+        self._lerp.a = current
         self._lerp.b = value
         self._position.retrigger()
 
     @property
     def rate(self) -> float:
         """The rate of change of interpolation in seconds. Must be greater than 0.001s."""
-        return 1 / self._position.rate
+        return self._rate
 
     @rate.setter
     def rate(self, value: float) -> None:
-        self._position.rate = 1 / max(value, 0.001)
+        self._rate = value if value > 0.001 else 0.001
+        self._position.rate = 1.0 / self._rate
 
 
 class AREnvelope:
@@ -213,14 +248,15 @@ class Voice:
         self._velocity = 0.0
 
         self._velocity_amount = 1.0
+        self._velocity_mod = 0.0
 
-        self._filter_frequency = synthesizer.sample_rate / 2
+        self._nyquist = synthesizer.sample_rate * 0.5
+        self._filter_frequency = self._nyquist
         self._filter_resonance = 0.7071067811865475
         self.filter_mode = synthio.FilterMode.LOW_PASS  # constructs self._filter
 
     def _append_blocks(self) -> None:
-        for block in self.blocks:
-            self._synthesizer.blocks.append(block)
+        self._synthesizer.blocks.extend(self.blocks)
 
     @property
     def notes(self) -> tuple[synthio.Note]:
@@ -245,8 +281,9 @@ class Voice:
             a midi velocity value.
         """
         if type(velocity) is int:
-            velocity /= 127
-        self._velocity = velocity
+            velocity *= _INV_127
+        self._velocity = _clamp(velocity, 0.0, 1.0)
+        self._update_velocity_mod()
         self._update_envelope()
         if notenum == self._notenum:
             return False
@@ -280,8 +317,11 @@ class Voice:
     def amplitude(self, value: float) -> None:
         pass
 
+    def _update_velocity_mod(self) -> None:
+        self._velocity_mod = 1.0 - (1.0 - self._velocity) * self._velocity_amount
+
     def _get_velocity_mod(self) -> float:
-        return 1.0 - (1.0 - min(max(self._velocity, 0.0), 1.0)) * self._velocity_amount
+        return self._velocity_mod
 
     @property
     def velocity_amount(self) -> float:
@@ -293,7 +333,8 @@ class Voice:
 
     @velocity_amount.setter
     def velocity_amount(self, value: float) -> None:
-        self._velocity_amount = min(max(value, 0.0), 1.0)
+        self._velocity_amount = _clamp(value, 0.0, 1.0)
+        self._update_velocity_mod()
 
     def _update_envelope(self) -> None:
         pass
@@ -320,6 +361,8 @@ class Voice:
 
     @filter_mode.setter
     def filter_mode(self, value: synthio.FilterMode) -> None:
+        if self.notes and self.notes[0].filter is not None and self.notes[0].filter.mode == value:
+            return
         self._update_filter(value)
 
     @property
@@ -331,7 +374,7 @@ class Voice:
 
     @filter_frequency.setter
     def filter_frequency(self, value: float) -> None:
-        self._filter_frequency = min(max(value, 0), self._synthesizer.sample_rate / 2)
+        self._filter_frequency = _clamp(value, 0, self._nyquist)
         self._update_filter_frequency()
 
     @property
@@ -3,10 +3,10 @@
 #
 # SPDX-License-Identifier: MIT
 
-import math
+import array
 
 import synthio
-import ulab.numpy as np
+from micropython import const
 
 import synthvoice
 
@@ -15,7 +15,25 @@ try:
 except ImportError:
     pass
 
-_LOG_2 = math.log(2)
+_ENVELOPE_DIRTY = const(1)
+_TUNE_DIRTY = const(2)
+
+# Shared by the delay and slew LFOs of every voice, must never be modified
+_RAMP_UP = array.array("h", (0, 32767))
+_RAMP_DOWN = array.array("h", (32767, 0))
+
+
+def _delayed_lfo(
+    rate: float = 1.0, scale: float = 0.0, offset: float = 0.0, delay: float = 0.001
+) -> tuple[synthio.Math, synthio.LFO, synthio.LFO]:
+    # Returns the product block along with the LFO and its delay ramp
+    lfo = synthio.LFO(waveform=None, rate=rate, scale=scale, offset=offset)
+    delay_lfo = synthio.LFO(waveform=_RAMP_UP, rate=1 / delay, once=True)
+    return synthio.Math(synthio.MathOperation.PRODUCT, lfo, delay_lfo), lfo, delay_lfo
+
+
+# Octaves relative to 440hz (A4) of each MIDI note number
+_MIDI_OCTAVES = tuple((notenum - 69) / 12 for notenum in range(128))
 
 
 class Oscillator(synthvoice.Voice):
@@ -25,6 +43,16 @@ class Oscillator(synthvoice.Voice):
     - pitch glide
     - waveform looping
 
+    The oscillator can be used as a context manager to change multiple envelope and tuning
+    properties at once. Updates are deferred until the end of the ``with`` block, ie:
+
+    .. code-block:: python
+
+        with voice:
+            voice.attack_time = 0.1
+            voice.decay_time = 0.5
+            voice.sustain_level = 0.5
+
     :param synthesizer: The :class:`synthio.Synthesizer` object this voice will be used with.
     :param root: The root frequency used to calculate tuning. Defaults to 440.0hz. Changing this
         value will effect tuning properties.
@@ -37,12 +65,20 @@ class Oscillator(synthvoice.Voice):
         self._velocity = 0.0
 
         self._velocity_amount = 1.0
+        self._velocity_mod = 0.0
+
+        self._dirty = 0
+        self._defer_depth = 0
 
         self._root = root
         self._coarse_tune = 0.0
         self._fine_tune = 0.0
+        self._tune_ratio = 1.0
+        self._root_offset = synthvoice._log2(440.0 / root)
+        self._frequency = root
         self._bend_range = 0.0
         self._bend = 0.0
+        self._pitch_bend = 0.0
         self._waveform_loop = (0.0, 1.0)
 
         self._freq_lerp = synthvoice.LerpBlockInput(
@@ -59,104 +95,85 @@ class Oscillator(synthvoice.Voice):
         self._decay_time = 0.0
         self._sustain_level = 0.75
         self._release_time = 0.0
+        self._envelope_mod = None
+
+        self._tremolo_delay = 0.001
+        self._vibrato_delay = 0.001
+        self._pan_delay = 0.001
+        self._filter_delay = 0.001
+        self._pitch_slew_time = 0.001
+
+        tremolo, self._tremolo_lfo, self._tremolo_delay_lfo = _delayed_lfo()
+        vibrato, self._vibrato_lfo, self._vibrato_delay_lfo = _delayed_lfo()
+        panning, self._panning_lfo, self._panning_delay_lfo = _delayed_lfo()
+        self._pitch_slew_lfo = synthio.LFO(
+            waveform=_RAMP_DOWN,
+            rate=1 / 0.001,
+            scale=0.0,
+            offset=0.0,
+            once=True,
+        )
+
+        self._amplitude_block = synthio.Math(synthio.MathOperation.SUM, 1.0, tremolo, 0.0)
+        self._bend_block = synthio.Math(
+            synthio.MathOperation.SUM,
+            self._freq_lerp.block,  # Frequency Lerp
+            vibrato,
+            synthio.Math(
+                synthio.MathOperation.SUM,
+                self._pitch_slew_lfo,
+                self._pitch_lerp.block,  # Pitch Bend Lerp
+                0.0,
+            ),
+        )
 
         self._note = synthio.Note(
             frequency=self._root,
             waveform=None,
             envelope=None,
-            amplitude=synthio.Math(
-                synthio.MathOperation.SUM,
-                1.0,
-                synthio.Math(
-                    synthio.MathOperation.PRODUCT,
-                    synthio.LFO(  # Tremolo LFO
-                        waveform=None, rate=1.0, scale=0.0
-                    ),
-                    synthio.LFO(  # Tremolo Delay
-                        waveform=np.array([0, 32767], dtype=np.int16),
-                        rate=1 / 0.001,
-                        once=True,
-                    ),
-                ),
-                0.0,
-            ),
-            bend=synthio.Math(
-                synthio.MathOperation.SUM,
-                self._freq_lerp.block,  # Frequency Lerp
-                synthio.Math(
-                    synthio.MathOperation.PRODUCT,
-                    synthio.LFO(  # Vibrato LFO
-                        waveform=None, rate=1.0, scale=0.0, offset=0.0
-                    ),
-                    synthio.LFO(  # Vibrato Delay
-                        waveform=np.array([0, 32767], dtype=np.int16),
-                        rate=1 / 0.001,
-                        once=True,
-                    ),
-                ),
-                synthio.Math(
-                    synthio.MathOperation.SUM,
-                    synthio.LFO(  # Pitch Slew
-                        waveform=np.array([32767, 0], dtype=np.int16),
-                        rate=1 / 0.001,
-                        scale=0.0,
-                        offset=0.0,
-                        once=True,
-                    ),
-                    self._pitch_lerp.block,  # Pitch Bend Lerp
-                    0.0,
-                ),
-            ),
-            panning=synthio.Math(
-                synthio.MathOperation.PRODUCT,
-                synthio.LFO(waveform=None, rate=1.0, scale=0.0, offset=0.0),  # Panning LFO
-                synthio.LFO(  # Panning Delay
-                    waveform=np.array([0, 32767], dtype=np.int16),
-                    rate=1 / 0.001,
-                    once=True,
-                ),
-            ),
+            amplitude=self._amplitude_block,
+            bend=self._bend_block,
+            panning=panning,
         )
         self._update_envelope()
 
-        self._filter_frequency = synthesizer.sample_rate / 2
+        self._nyquist = synthesizer.sample_rate * 0.5
+        self._filter_frequency = self._nyquist
         self._filter_resonance = 0.7071067811865475
         self._filter_envelope = synthvoice.AREnvelope(
             attack_time=0.0,
             release_time=0.0,
             amount=0.0,
         )
+        filter_lfo, self._filter_lfo, self._filter_delay_lfo = _delayed_lfo()
+        self._filter_sum_block = synthio.Math(
+            synthio.MathOperation.SUM,
+            self._filter_frequency,
+            self._filter_envelope.block,
+            filter_lfo,
+        )
         self._filter_frequency_block = synthio.Math(
             synthio.MathOperation.MAX,
-            synthio.Math(
-                synthio.MathOperation.SUM,
-                self._filter_frequency,
-                self._filter_envelope.block,
-                synthio.Math(
-                    synthio.MathOperation.PRODUCT,
-                    synthio.LFO(  # Filter LFO
-                        waveform=None,
-                        rate=1.0,
-                        scale=0.0,
-                        offset=0.0,
-                    ),
-                    synthio.LFO(  # Filter Delay
-                        waveform=np.array([0, 32767], dtype=np.int16),
-                        rate=1 / 0.001,
-                        once=True,
-                    ),
-                ),
-            ),
+            self._filter_sum_block,
             50.0,  # Minimum allowed frequency
         )
         self.filter_mode = synthio.FilterMode.LOW_PASS  # constructs self._filter
 
+        # Pairs of modulation LFOs and the LFOs to retrigger when pressed
+        self._retrigger_lfos = (
+            (self._filter_lfo, self._filter_delay_lfo),
+            (self._tremolo_lfo, self._tremolo_delay_lfo),
+            (self._vibrato_lfo, self._vibrato_delay_lfo),
+            (self._pitch_slew_lfo, self._pitch_slew_lfo),
+            (self._panning_lfo, self._panning_delay_lfo),
+        )
+
         self._append_blocks()
 
     @property
     def notes(self) -> tuple[synthio.Note]:
         """Get all :class:`synthio.Note` objects attributed to this voice."""
-        return tuple([self._note])
+        return (self._note,)
 
     @property
     def blocks(self) -> tuple[synthio.BlockInput]:
@@ -167,26 +184,48 @@ class Oscillator(synthvoice.Voice):
             + self._pitch_lerp.blocks
             + (
                 self._filter_frequency_block,
-                self._filter_frequency_block.a,
-                self._filter_frequency_block.a.c,
-                self._filter_frequency_block.a.c.a,  # Filter LFO
-                self._filter_frequency_block.a.c.b,  # Filter Delay
-                self._note.amplitude,
-                self._note.amplitude.b,
-                self._note.amplitude.b.a,  # Tremolo LFO
-                self._note.amplitude.b.b,  # Tremolo Delay
-                self._note.bend,
-                self._note.bend.b,
-                self._note.bend.b.a,  # Vibrato LFO
-                self._note.bend.b.b,  # Vibrato Delay
-                self._note.bend.c,
-                self._note.bend.c.a,  # Pitch Slew
+                self._filter_sum_block,
+                self._filter_sum_block.c,
+                self._filter_lfo,
+                self._filter_delay_lfo,
+                self._amplitude_block,
+                self._amplitude_block.b,
+                self._tremolo_lfo,
+                self._tremolo_delay_lfo,
+                self._bend_block,
+                self._bend_block.b,
+                self._vibrato_lfo,
+                self._vibrato_delay_lfo,
+                self._bend_block.c,
+                self._pitch_slew_lfo,
                 self._note.panning,
-                self._note.panning.a,  # Panning LFO
-                self._note.panning.b,  # Panning Delay
+                self._panning_lfo,
+                self._panning_delay_lfo,
             )
         )
 
+    def __enter__(self) -> "Oscillator":
+        self._defer_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._defer_depth -= 1
+        if not self._defer_depth:
+            self._flush()
+
+    def _mark_dirty(self, flag: int) -> None:
+        self._dirty |= flag
+        if not self._defer_depth:
+            self._flush()
+
+    def _flush(self) -> None:
+        dirty, self._dirty = self._dirty, 0
+        if dirty & _ENVELOPE_DIRTY:
+            self._envelope_mod = None
+            self._update_envelope()
+        if dirty & _TUNE_DIRTY:
+            self._update_tune()
+
     def press(self, notenum: int, velocity: float | int = 1.0) -> bool:
         """Update the voice to be "pressed" with a specific MIDI note number and velocity. Returns
         whether or not a new note is received to avoid unnecessary retriggering. The envelope is
@@ -197,15 +236,25 @@ class Oscillator(synthvoice.Voice):
         """
         if not super().press(notenum, velocity):
             return False
-        self.frequency = synthio.midi_to_hz(notenum)
+        if 0 <= notenum < 128:
+            self._frequency = None  # Resolved from the note number when read
+            self._frequency_notenum = notenum
+            self._freq_lerp.value = _MIDI_OCTAVES[notenum] + self._root_offset
+        else:
+            self.frequency = synthio.midi_to_hz(notenum)
         self._filter_envelope.press()
-        self._filter_frequency_block.a.c.b.retrigger()
-        self._note.amplitude.b.b.retrigger()  # Tremolo Delay
-        self._note.bend.b.b.retrigger()  # Vibrato Delay
-        self._note.bend.c.a.retrigger()  # Pitch Slew
-        self._note.panning.b.retrigger()  # Panning Delay
+        # Inactive modulation is skipped, its depth setter retriggers the delay once raised
+        for lfo, delay_lfo in self._retrigger_lfos:
+            if lfo.scale != 0.0:
+                delay_lfo.retrigger()
         return True
 
+    def _set_delayed_depth(self, lfo: synthio.LFO, delay_lfo: synthio.LFO, value: float) -> None:
+        # press() skips the delay ramp of inactive modulation, so fade it in from here instead
+        if value != 0.0 and lfo.scale == 0.0 and self.pressed:
+            delay_lfo.retrigger()
+        lfo.scale = value
+
     def release(self) -> bool:
         """Release the voice if a note is currently being played. Returns `True` if a note was
         released and `False` if not.
@@ -215,8 +264,13 @@ class Oscillator(synthvoice.Voice):
         self._filter_envelope.release()
         return True
 
+    def _update_tune(self):
+        self._tune_ratio = synthvoice._semitone_ratio(self._coarse_tune * 12 + self._fine_tune)
+        self._update_root()
+
     def _update_root(self):
-        self._note.frequency = self._root * pow(2, self._coarse_tune + self._fine_tune / 12)
+        self._root_offset = synthvoice._log2(440.0 / self._root)
+        self._note.frequency = self._root * self._tune_ratio
 
     @property
     def coarse_tune(self) -> float:
@@ -227,8 +281,10 @@ class Oscillator(synthvoice.Voice):
 
     @coarse_tune.setter
     def coarse_tune(self, value: float) -> None:
+        if value == self._coarse_tune:
+            return
         self._coarse_tune = value
-        self._update_root()
+        self._mark_dirty(_TUNE_DIRTY)
 
     @property
     def fine_tune(self) -> float:
@@ -240,8 +296,10 @@ class Oscillator(synthvoice.Voice):
 
     @fine_tune.setter
     def fine_tune(self, value: float) -> None:
+        if value == self._fine_tune:
+            return
         self._fine_tune = value
-        self._update_root()
+        self._mark_dirty(_TUNE_DIRTY)
 
     @property
     def frequency(self) -> float:
@@ -249,11 +307,14 @@ class Oscillator(synthvoice.Voice):
         frequency lerp block to gradually change the note frequency based on the glide settings of
         this voice.
         """
-        return self._freq_lerp.value
+        if self._frequency is None:
+            return synthio.midi_to_hz(self._frequency_notenum)
+        return self._frequency
 
     @frequency.setter
     def frequency(self, value: float) -> None:
-        self._freq_lerp.value = math.log(value / self._root) / _LOG_2
+        self._frequency = value
+        self._freq_lerp.value = synthvoice._log2(value / self._root)
 
     @property
     def glide(self) -> float:
@@ -267,7 +328,11 @@ class Oscillator(synthvoice.Voice):
         self._freq_lerp.rate = value
 
     def _update_pitch_bend(self):
-        self._pitch_lerp.value = self._bend * self._bend_range
+        value = self._bend * self._bend_range
+        if value == self._pitch_bend:
+            return
+        self._pitch_bend = value
+        self._pitch_lerp.value = value
 
     @property
     def bend_range(self) -> float:
@@ -305,53 +370,55 @@ class Oscillator(synthvoice.Voice):
         starting with a relative :attr:`pitch_slew` adjustment. Must be greater than 0.0s. Defaults
         to 0.001s.
         """
-        return 1 / self._note.bend.c.a.rate
+        return self._pitch_slew_time
 
     @pitch_slew_time.setter
     def pitch_slew_time(self, value: float) -> None:
-        self._note.bend.c.a.rate = 1 / max(value, 0.001)
+        self._pitch_slew_time = max(value, 0.001)
+        self._pitch_slew_lfo.rate = 1 / self._pitch_slew_time
 
     @property
     def pitch_slew(self) -> float:
         """The pitch offset in octaves at which the voice starts relative to the desired frequency
         when first pressed. Can be either positive or negative. Defaults to 0.0.
         """
-        return self._note.bend.c.a.scale
+        return self._pitch_slew_lfo.scale
 
     @pitch_slew.setter
     def pitch_slew(self, value: float) -> None:
-        self._note.bend.c.a.scale = value
+        self._pitch_slew_lfo.scale = value
 
     @property
     def vibrato_rate(self) -> float:
         """The rate of the frequency LFO in hertz. Defaults to 1.0hz."""
-        return self._note.bend.b.a.rate
+        return self._vibrato_lfo.rate
 
     @vibrato_rate.setter
     def vibrato_rate(self, value: float) -> None:
-        self._note.bend.b.a.rate = value
+        self._vibrato_lfo.rate = value
 
     @property
     def vibrato_depth(self) -> float:
         """The depth of the frequency LFO in octaves relative to the current note frequency and
         :attr:`bend`. Defaults to 0.0.
         """
-        return self._note.bend.b.a.scale
+        return self._vibrato_lfo.scale
 
     @vibrato_depth.setter
     def vibrato_depth(self, value: float) -> None:
-        self._note.bend.b.a.scale = value
+        self._set_delayed_depth(self._vibrato_lfo, self._vibrato_delay_lfo, value)
 
     @property
     def vibrato_delay(self) -> float:
         """The amount of time to gradually increase the depth of the frequency LFO in seconds. Must
         be greater than 0.0s. Defaults to 0.001s.
         """
-        return 1 / self._note.bend.b.b.rate
+        return self._vibrato_delay
 
     @vibrato_delay.setter
     def vibrato_delay(self, value: float) -> None:
-        self._note.bend.b.b.rate = 1 / max(value, 0.001)
+        self._vibrato_delay = max(value, 0.001)
+        self._vibrato_delay_lfo.rate = 1 / self._vibrato_delay
 
     @property
     def waveform(self) -> ReadableBuffer | None:
@@ -364,24 +431,28 @@ class Oscillator(synthvoice.Voice):
         self._apply_waveform_loop()
 
     def _set_waveform_loop(self, value: tuple[float, float]) -> None:
-        start = min(max(value[0], 0.0), 1.0)
-        end = min(max(value[1], start), 1.0)
+        start = synthvoice._clamp(value[0], 0.0, 1.0)
+        end = synthvoice._clamp(value[1], start, 1.0)
         self._waveform_loop = (start, end)
-        self._apply_waveform_loop()
+        if self._note.waveform is not None:
+            self._apply_waveform_loop()
 
     def _apply_waveform_loop(self) -> None:
-        if self._note.waveform is not None and len(self._note.waveform) >= 2:
-            waveform_length = len(self._note.waveform)
-            self._note.waveform_loop_start = min(
-                max(int(self._waveform_loop[0] * waveform_length), 0), waveform_length - 2
-            )
-            self._note.waveform_loop_end = min(
-                max(
-                    int(self._waveform_loop[1] * waveform_length),
-                    self._note.waveform_loop_start + 2,
-                ),
-                waveform_length,
-            )
+        waveform = self._note.waveform
+        if waveform is None:
+            return
+        length = len(waveform)
+        if length < 2:
+            return
+
+        start = int(self._waveform_loop[0] * length)
+        start = synthvoice._clamp(start, 0, length - 2)
+
+        end = int(self._waveform_loop[1] * length)
+        end = synthvoice._clamp(end, start + 2, length)
+
+        self._note.waveform_loop_start = start
+        self._note.waveform_loop_end = end
 
     @property
     def waveform_loop(self) -> tuple[float, float]:
@@ -400,87 +471,93 @@ class Oscillator(synthvoice.Voice):
         """The relative amplitude of the oscillator from 0.0 to 1.0. An amplitude of 0 makes the
         oscillator inaudible. Defaults to 1.0.
         """
-        return self._note.amplitude.a
+        return self._amplitude_block.a
 
     @amplitude.setter
     def amplitude(self, value: float) -> None:
-        self._note.amplitude.a = value
+        self._amplitude_block.a = value
 
     @property
     def tremolo_rate(self) -> float:
         """The rate of the amplitude LFO in hertz. Defaults to 1.0hz."""
-        return self._note.amplitude.b.a.rate
+        return self._tremolo_lfo.rate
 
     @tremolo_rate.setter
     def tremolo_rate(self, value: float) -> None:
-        self._note.amplitude.b.a.rate = value
+        self._tremolo_lfo.rate = value
 
     @property
     def tremolo_depth(self) -> float:
         """The depth of the amplitude LFO. This value is added to :attr:`amplitude`. Defaults to
         0.0.
         """
-        return self._note.amplitude.b.a.scale
+        return self._tremolo_lfo.scale
 
     @tremolo_depth.setter
     def tremolo_depth(self, value: float) -> None:
-        self._note.amplitude.b.a.scale = value
+        self._set_delayed_depth(self._tremolo_lfo, self._tremolo_delay_lfo, value)
 
     @property
     def tremolo_delay(self) -> float:
         """The amount of time to gradually increase the depth of the amplitude LFO in seconds. Must
         be greater than 0.0s. Defaults to 0.001s.
         """
-        return 1 / self._note.amplitude.b.b.rate
+        return self._tremolo_delay
 
     @tremolo_delay.setter
     def tremolo_delay(self, value: float) -> None:
-        self._note.amplitude.b.b.rate = 1 / max(value, 0.001)
+        self._tremolo_delay = max(value, 0.001)
+        self._tremolo_delay_lfo.rate = 1 / self._tremolo_delay
 
     @property
     def pan(self) -> float:
         """The distribution of the oscillator amplitude in the channel(s) output from -1.0 (left) to
         1.0 (right). Defaults to 0.0.
         """
-        return self._note.panning.a.offset
+        return self._panning_lfo.offset
 
     @pan.setter
     def pan(self, value: float) -> None:
-        self._note.panning.a.offset = value
+        self._panning_lfo.offset = value
 
     @property
     def pan_rate(self) -> float:
         """The rate of the panning LFO in hertz. Defaults to 1.0."""
-        return self._note.panning.a.rate
+        return self._panning_lfo.rate
 
     @pan_rate.setter
     def pan_rate(self, value: float) -> None:
-        self._note.panning.a.rate = value
+        self._panning_lfo.rate = value
 
     @property
     def pan_depth(self) -> float:
         """The depth of the panning LFO from 0.0 to 1.0. This value is added to :attr:`pan`.
         Negative values are allowed and will flip the phase of the LFO. Defaults to 0.0.
         """
-        return self._note.panning.a.scale
+        return self._panning_lfo.scale
 
     @pan_depth.setter
     def pan_depth(self, value: float) -> None:
-        self._note.panning.a.scale = value
+        self._set_delayed_depth(self._panning_lfo, self._panning_delay_lfo, value)
 
     @property
     def pan_delay(self) -> float:
         """The amount of time to gradually increase the depth of the panning LFO in seconds. Must be
         greater than 0.0s. Defaults to 0.001s.
         """
-        return 1 / self._note.panning.b.rate
+        return self._pan_delay
 
     @pan_delay.setter
     def pan_delay(self, value: float) -> None:
-        self._note.panning.b.rate = 1 / max(value, 0.001)
+        self._pan_delay = max(value, 0.001)
+        self._panning_delay_lfo.rate = 1 / self._pan_delay
 
     def _update_envelope(self):
+        # Envelope settings only change through _flush, so a repeated velocity is a no-op
         mod = self._get_velocity_mod()
+        if mod == self._envelope_mod:
+            return
+        self._envelope_mod = mod
         self._note.envelope = synthio.Envelope(
             attack_time=self._attack_time,
             attack_level=mod * self._attack_level,
@@ -499,7 +576,7 @@ class Oscillator(synthvoice.Voice):
     @attack_time.setter
     def attack_time(self, value: float) -> None:
         self._attack_time = max(value, 0.0)
-        self._update_envelope()
+        self._mark_dirty(_ENVELOPE_DIRTY)
 
     @property
     def attack_level(self) -> float:
@@ -510,8 +587,8 @@ class Oscillator(synthvoice.Voice):
 
     @attack_level.setter
     def attack_level(self, value: float) -> None:
-        self._attack_level = min(max(value, 0.0), 1.0)
-        self._update_envelope()
+        self._attack_level = synthvoice._clamp(value, 0.0, 1.0)
+        self._mark_dirty(_ENVELOPE_DIRTY)
 
     @property
     def decay_time(self) -> float:
@@ -523,7 +600,7 @@ class Oscillator(synthvoice.Voice):
     @decay_time.setter
     def decay_time(self, value: float) -> None:
         self._decay_time = max(value, 0.0)
-        self._update_envelope()
+        self._mark_dirty(_ENVELOPE_DIRTY)
 
     @property
     def sustain_level(self) -> float:
@@ -535,8 +612,8 @@ class Oscillator(synthvoice.Voice):
 
     @sustain_level.setter
     def sustain_level(self, value: float) -> None:
-        self._sustain_level = min(max(value, 0.0), 1.0)
-        self._update_envelope()
+        self._sustain_level = synthvoice._clamp(value, 0.0, 1.0)
+        self._mark_dirty(_ENVELOPE_DIRTY)
 
     @property
     def release_time(self) -> float:
@@ -548,7 +625,7 @@ class Oscillator(synthvoice.Voice):
     @release_time.setter
     def release_time(self, value: float) -> None:
         self._release_time = max(value, 0.0)
-        self._update_envelope()
+        self._mark_dirty(_ENVELOPE_DIRTY)
 
     def _update_filter(self, mode: synthio.FilterMode = None, biquad: synthio.BlockBiquad = None) -> None:
         if mode is None:
@@ -558,7 +635,7 @@ class Oscillator(synthvoice.Voice):
         super()._update_filter(mode, biquad)
 
     def _update_filter_frequency(self) -> None:
-        self._filter_frequency_block.a.a = self._filter_frequency
+        self._filter_sum_block.a = self._filter_frequency
 
     @property
     def filter_attack_time(self) -> float:
@@ -598,30 +675,31 @@ class Oscillator(synthvoice.Voice):
     @property
     def filter_rate(self) -> float:
         """The rate in hertz of the filter frequency LFO. Defaults to 1.0hz."""
-        return self._filter_frequency_block.a.c.a.rate
+        return self._filter_lfo.rate
 
     @filter_rate.setter
     def filter_rate(self, value: float) -> None:
-        self._filter_frequency_block.a.c.a.rate = value
+        self._filter_lfo.rate = value
 
     @property
     def filter_depth(self) -> float:
         """The maximum level of the filter LFO to add to :attr:`filter_frequency` in hertz in both
         positive and negative directions. Defaults to 0.0hz.
         """
-        return self._filter_frequency_block.a.c.a.scale
+        return self._filter_lfo.scale
 
     @filter_depth.setter
     def filter_depth(self, value: float) -> None:
-        self._filter_frequency_block.a.c.a.scale = value
+        self._set_delayed_depth(self._filter_lfo, self._filter_delay_lfo, value)
 
     @property
     def filter_delay(self) -> float:
         """The amount of time to gradually increase the depth of the filter LFO in seconds. Must be
         greater than 0.0s. Defaults to 0.001s.
         """
-        return 1 / self._filter_frequency_block.a.c.b.rate
+        return self._filter_delay
 
     @filter_delay.setter
     def filter_delay(self, value: float) -> None:
-        self._filter_frequency_block.a.c.b.rate = 1 / max(value, 0.001)
+        self._filter_delay = max(value, 0.001)
+        self._filter_delay_lfo.rate = 1 / self._filter_delay
@@ -14,6 +14,16 @@ try:
 except ImportError:
     pass
 
+# Shared by every drum voice, must never be modified
+_LFO_RAMP_DOWN = np.array([32767, -32768], dtype=np.int16)
+_SINE = synthwaveform.sine()
+_OFFSET_SINE = synthwaveform.sine(phase=0.5)
+_NOISE = synthwaveform.noise()
+_SINE_NOISE = synthwaveform.mix(_SINE, (_NOISE, 0.5))
+_OFFSET_SINE_NOISE = synthwaveform.mix(_OFFSET_SINE, (_NOISE, 0.5))
+_TRIANGLE = synthwaveform.triangle()
+_QUIET_NOISE = synthwaveform.noise(amplitude=0.25)
+
 
 class Voice(synthvoice.Voice):
     """Base single-shot "analog" drum voice used by other classes within the percussive module.
@@ -43,32 +53,35 @@ class Voice(synthvoice.Voice):
         waveforms: tuple[ReadableBuffer] | ReadableBuffer = [],
     ):
         if not frequencies:
-            frequencies = tuple([440.0])
+            frequencies = (440.0,)
         if not times:
-            times = tuple([1.0])
+            times = (1.0,)
 
         self._times = times
         self._attack_level = 1.0
         self._decay_time = 0.0
+        self._envelope_attack_level = None
 
         self._lfo = synthio.LFO(
-            waveform=np.array([32767, -32768], dtype=np.int16),
+            waveform=_LFO_RAMP_DOWN,
             rate=20.0,
             scale=0.3,
             offset=0.33,
             once=True,
         )
+        self._blocks = (self._lfo,)
 
-        self._frequencies = frequencies
         self._tune = 0.0
+        self._tune_ratio = 1.0
 
+        n = len(frequencies)
         self._notes = tuple(
-            [
-                synthio.Note(frequency=frequencies[i % len(frequencies)], bend=self._lfo)
-                for i in range(count)
-            ]
+            synthio.Note(frequency=frequencies[i % n], bend=self._lfo) for i in range(count)
         )
-        
+        self._waveforms = (None,) * count
+        self._frequency_buffer = np.zeros(count, dtype=np.float)
+        self.frequencies = frequencies
+
         super().__init__(synthesizer)
 
         self.times = times
@@ -85,11 +98,16 @@ class Voice(synthvoice.Voice):
     @property
     def blocks(self) -> tuple[synthio.BlockInput]:
         """Get all :class:`synthio.BlockInput` objects attributed to this voice."""
-        return tuple([self._lfo])
+        return self._blocks
 
     def _update_frequencies(self) -> None:
-        for i, note in enumerate(self.notes):
-            note.frequency = self._frequencies[i % len(self._frequencies)] * pow(2, self._tune / 12)
+        frequencies = self._frequency_buffer
+        frequencies[:] = self._note_frequencies
+        if self._tune_ratio != 1.0:
+            frequencies *= self._tune_ratio
+        notes = self._notes
+        for i in range(len(notes)):
+            notes[i].frequency = frequencies[i]
 
     @property
     def frequencies(self) -> tuple[float]:
@@ -99,9 +117,13 @@ class Voice(synthvoice.Voice):
     @frequencies.setter
     def frequencies(self, value: tuple[float] | float) -> None:
         if not isinstance(value, tuple):
-            value = tuple([value])
+            value = (value,)
         if value:
             self._frequencies = value
+            n = len(value)
+            self._note_frequencies = np.array(
+                [value[i % n] for i in range(len(self._notes))], dtype=np.float
+            )
             self._update_frequencies()
 
     @property
@@ -109,10 +131,14 @@ class Voice(synthvoice.Voice):
         """The amount of tuning form the root frequencies of the voice in semitones (1/12 of an
         octave). Defaults to 0.0.
         """
+        return self._tune
 
     @tune.setter
     def tune(self, value: float) -> None:
+        if value == self._tune:
+            return
         self._tune = value
+        self._tune_ratio = synthvoice._semitone_ratio(value)
         self._update_frequencies()
 
     @property
@@ -123,29 +149,30 @@ class Voice(synthvoice.Voice):
     @times.setter
     def times(self, value: tuple[float] | float) -> None:
         if not isinstance(value, tuple):
-            value = tuple([value])
+            value = (value,)
         if value:
             self._times = value
-            self._update_envelope()
+            n = len(value)
+            self._note_times = tuple(value[i % n] for i in range(len(self._notes)))
+            self._update_decay_times()
 
     @property
     def waveforms(self) -> tuple[ReadableBuffer]:
         """The note waveforms as :class:`ulab.numpy.ndarray` objects with the
         :class:`ulab.numpy.int16` data type.
         """
-        value = []
-        for note in self.notes:
-            value.append(note.waveform)
-        return tuple(value)
+        return self._waveforms
 
     @waveforms.setter
     def waveforms(self, value: tuple[ReadableBuffer] | ReadableBuffer) -> None:
         if not value:
             return
         if not isinstance(value, tuple):
-            value = tuple([value])
-        for i, note in enumerate(self.notes):
-            note.waveform = value[i % len(value)]
+            value = (value,)
+        n = len(value)
+        self._waveforms = tuple(value[i % n] for i in range(len(self._notes)))
+        for i, note in enumerate(self._notes):
+            note.waveform = self._waveforms[i]
 
     def press(self, velocity: float | int = 1.0) -> bool:
         """Update the voice to be "pressed". For percussive voices, this will begin the playback of
@@ -171,8 +198,9 @@ class Voice(synthvoice.Voice):
 
     @amplitude.setter
     def amplitude(self, value: float) -> None:
-        for note in self.notes:
-            note.amplitude = min(max(value, 0.0), 1.0)
+        value = synthvoice._clamp(value, 0.0, 1.0)
+        for note in self._notes:
+            note.amplitude = value
 
     @property
     def pan(self) -> float:
@@ -181,18 +209,29 @@ class Voice(synthvoice.Voice):
 
     @pan.setter
     def pan(self, value: float) -> None:
-        value = min(max(value, -1.0), 1.0)
-        for note in self.notes:
+        value = synthvoice._clamp(value, -1.0, 1.0)
+        for note in self._notes:
             note.panning = value
 
+    def _update_decay_times(self) -> None:
+        decay_mod = 2.0**self._decay_time
+        self._note_decay_times = tuple(time * decay_mod for time in self._note_times)
+        self._envelope_attack_level = None
+        self._update_envelope()
+
     def _update_envelope(self) -> None:
-        mod = self._get_velocity_mod()
-        for i, note in enumerate(self.notes):
+        # Decay times reset the cached level when changed, so a repeated level is a no-op
+        attack_level = self._get_velocity_mod() * self._attack_level
+        if attack_level == self._envelope_attack_level:
+            return
+        self._envelope_attack_level = attack_level
+        decay_times = self._note_decay_times
+        for i, note in enumerate(self._notes):
             note.envelope = synthio.Envelope(
                 attack_time=0.0,
-                decay_time=self._times[i % len(self._times)] * pow(2, self._decay_time),
+                decay_time=decay_times[i],
                 release_time=0.0,
-                attack_level=mod * self._attack_level,
+                attack_level=attack_level,
                 sustain_level=0.0,
             )
 
@@ -203,7 +242,10 @@ class Voice(synthvoice.Voice):
 
     @attack_level.setter
     def attack_level(self, value: float) -> None:
-        self._attack_level = min(max(value, 0.0), 1.0)
+        value = synthvoice._clamp(value, 0.0, 1.0)
+        if value == self._attack_level:
+            return
+        self._attack_level = value
         self._update_envelope()
 
     @property
@@ -215,23 +257,23 @@ class Voice(synthvoice.Voice):
 
     @decay_time.setter
     def decay_time(self, value: float) -> None:
+        if value == self._decay_time:
+            return
         self._decay_time = value
-        self._update_envelope()
+        self._update_decay_times()
 
 
 class Kick(Voice):
     """A single-shot "analog" drum voice representing a low frequency sine-wave kick drum."""
 
     def __init__(self, synthesizer: synthio.Synthesizer):
-        sine = synthwaveform.sine()
-        offset_sine = synthwaveform.sine(phase=0.5)
         super().__init__(
             synthesizer,
             count=3,
             filter_frequency=2000.0,
             frequencies=(53.0, 72.0, 41.0),
             times=(0.075, 0.055, 0.095),
-            waveforms=(offset_sine, sine, offset_sine),
+            waveforms=(_OFFSET_SINE, _SINE, _OFFSET_SINE),
         )
 
 
@@ -241,21 +283,13 @@ class Snare(Voice):
     """
 
     def __init__(self, synthesizer: synthio.Synthesizer):
-        sine_noise = synthwaveform.mix(
-            synthwaveform.sine(),
-            (synthwaveform.noise(), 0.5),
-        )
-        offset_sine_noise = synthwaveform.mix(
-            synthwaveform.sine(phase=0.5),
-            (synthwaveform.noise(), 0.5),
-        )
         super().__init__(
             synthesizer,
             count=3,
             filter_frequency=9500.0,
             frequencies=(90.0, 135.0, 165.0),
             times=(0.115, 0.095, 0.115),
-            waveforms=(sine_noise, offset_sine_noise, offset_sine_noise),
+            waveforms=(_SINE_NOISE, _OFFSET_SINE_NOISE, _OFFSET_SINE_NOISE),
         )
 
 
@@ -278,7 +312,7 @@ class Cymbal(Voice):
             filter_mode=synthio.FilterMode.HIGH_PASS,
             filter_frequency=frequency,
             frequencies=(90, 135, 165.0),
-            waveforms=synthwaveform.noise(),
+            waveforms=_NOISE,
             times=(time, max(time - 0.02, 0.001), time),
         )
 
@@ -327,9 +361,9 @@ class Tom(Voice):
             synthesizer,
             count=2,
             filter_frequency=4000.0,
-            waveforms=(synthwaveform.triangle(), synthwaveform.noise(amplitude=0.25)),
+            waveforms=(_TRIANGLE, _QUIET_NOISE),
             times=(time, 0.025),
-            frequencies=tuple([frequency]),
+            frequencies=(frequency,),
         )
 
 
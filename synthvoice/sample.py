@@ -13,11 +13,9 @@ import ulab.utils
 
 import synthvoice.oscillator
 
-_LOG_2 = math.log(2)
-
 
 def is_pow2(value: float | int) -> bool:
-    value = math.log(value) / _LOG_2
+    value = synthvoice._log2(value)
     return math.ceil(value) == math.floor(value)
 
 
@@ -121,6 +119,8 @@ class Sample(synthvoice.oscillator.Oscillator):
         self._sample_rate = synthesizer.sample_rate
         self._sample_tune = 0.0
         self._loop_tune = 0.0
+        self._source_tune = 0.0
+        self._source_ratio = 1.0
         self._start = None
         self._desired_frequency = self._root
         self._max_size = max_size
@@ -138,12 +138,16 @@ class Sample(synthvoice.oscillator.Oscillator):
             )
             self._cycle_duration = 1 / self._root
             self._source_duration = len(self._note.waveform) / self._sample_rate
-            self._source_tune = math.log(self._cycle_duration / self._source_duration) / _LOG_2
+            self._source_tune = synthvoice._log2(self._cycle_duration / self._source_duration)
         else:
             self._root = self._desired_frequency
             self._cycle_duration = 1.0 / self._root
             self._source_duration = 0.0
             self._source_tune = 0.0
+        self._update_source_tune()
+
+    def _update_source_tune(self) -> None:
+        self._source_ratio = 2.0 ** (self._source_tune + self._loop_tune)
         self._update_root()
 
     @property
@@ -198,7 +202,7 @@ class Sample(synthvoice.oscillator.Oscillator):
         return (
             self._source_duration
             * self._root
-            / pow(2, self._note.bend.value)
+            / 2.0**self._bend_block.value
             / self._desired_frequency
         )
 
@@ -223,13 +227,13 @@ class Sample(synthvoice.oscillator.Oscillator):
 
         sample_length = len(self._note.waveform)
         self._loop_tune = (
-            math.log(sample_length / length) / _LOG_2 if length != sample_length else 0.0
+            synthvoice._log2(sample_length / length) if length != sample_length else 0.0
         )
-        self._update_root()
+        self._update_source_tune()
 
     def _update_root(self):
         super()._update_root()
-        self._note.frequency = self._note.frequency * pow(2, self._source_tune + self._loop_tune)
+        self._note.frequency = self._note.frequency * self._source_ratio
 
     def update(self):
         """Update sample timing when :attr:`looping` is set to `False`."""